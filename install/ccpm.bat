@@ -4,7 +4,7 @@ set REPO_URL=https://github.com/automazeio/ccpm.git
 set TARGET_DIR=.
 
 echo Cloning repository from %REPO_URL%...
-git clone %REPO_URL% %TARGET_DIR%
+git clone --depth 1 --single-branch --no-tags %REPO_URL% %TARGET_DIR%
 
 if %ERRORLEVEL% EQU 0 (
     echo Clone successful. Removing .git directory...
@@ -4,7 +4,7 @@ REPO_URL="https://github.com/automazeio/ccpm.git"
 TARGET_DIR="."
 
 echo "Cloning repository from $REPO_URL..."
-git clone "$REPO_URL" "$TARGET_DIR"
+git clone --depth 1 --single-branch --no-tags "$REPO_URL" "$TARGET_DIR"
 
 if [ $? -eq 0 ]; then
     echo "Clone successful. Removing .git directory..."